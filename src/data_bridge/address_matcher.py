@@ -1,9 +1,13 @@
 import re
+import sys
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Union, Any, Tuple
 from pathlib import Path
 
-from thefuzz import fuzz, process
+from rapidfuzz import fuzz, process
+import numpy as np
 import pandas as pd
 
 from .db_connector import DatabaseConnector
@@ -11,12 +15,114 @@ from .db_connector import DatabaseConnector
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used on every normalize call
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+_NOISE_RE = re.compile(r'\b(?:UNIT|APT|BUILDING|FLOOR)\s+\w+\b|#\w+')
+
+class _LRUCache(OrderedDict):
+    """Dictionary that evicts its least recently used entry beyond maxsize."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
 class AddressMatcher:
     """
     Address matching service for parcel identification.
     Uses fuzzy matching to identify parcels based on address strings.
     """
 
+    # Street type spellings and their standard abbreviations
+    STREET_TYPES = {
+        'AVENUE': 'AVE',
+        'BOULEVARD': 'BLVD',
+        'CIRCLE': 'CIR',
+        'COURT': 'CT',
+        'DRIVE': 'DR',
+        'EXPRESSWAY': 'EXPY',
+        'HIGHWAY': 'HWY',
+        'LANE': 'LN',
+        'PARKWAY': 'PKWY',
+        'PLACE': 'PL',
+        'ROAD': 'RD',
+        'SQUARE': 'SQ',
+        'STREET': 'ST',
+        'TERRACE': 'TER',
+        'TRAIL': 'TRL',
+        'WAY': 'WAY'
+    }
+    STREET_TYPE_ABBREVIATIONS = frozenset(STREET_TYPES.values())
+
+    # Directional spellings and their standard abbreviations
+    DIRECTIONS = {
+        'NORTH': 'N',
+        'SOUTH': 'S',
+        'EAST': 'E',
+        'WEST': 'W',
+        'NORTHEAST': 'NE',
+        'NORTHWEST': 'NW',
+        'SOUTHEAST': 'SE',
+        'SOUTHWEST': 'SW'
+    }
+
+    # Every spelling rewritten during normalization, looked up per token
+    _TOKEN_ABBREVIATIONS = {
+        **{full: abbrev for full, abbrev in STREET_TYPES.items() if full != abbrev},
+        **DIRECTIONS
+    }
+
+    # Parcel candidate query for each (has street number, has street name)
+    # combination. TOP 100 (SQL Server has no LIMIT) caps the rows shipped to
+    # Python; an index on parcel(street_number, street_name) keeps this a seek.
+    # This query will depend on the specific database schema.
+    _CANDIDATE_SELECT = """
+            SELECT TOP 100
+                pid,
+                situs_address AS full_address,
+                street_number,
+                street_name,
+                street_type,
+                city,
+                state,
+                zip_code
+            FROM
+                parcel
+            WHERE
+                1=1
+            """
+    _CANDIDATE_QUERIES = {
+        (False, False): _CANDIDATE_SELECT + " ORDER BY pid",
+        (True, False): _CANDIDATE_SELECT + " AND street_number = ? ORDER BY pid",
+        (False, True): _CANDIDATE_SELECT + " AND street_name LIKE ? ORDER BY pid",
+        (True, True): _CANDIDATE_SELECT + " AND street_number = ? AND street_name LIKE ? ORDER BY pid"
+    }
+
+    # Maximum entries kept in each per-instance cache
+    CACHE_SIZE = 10000
+
+    # Columns returned by the parcel candidate query, in order
+    PARCEL_COLUMNS = (
+        'pid', 'full_address', 'street_number', 'street_name',
+        'street_type', 'city', 'state', 'zip_code'
+    )
+
+    # Single pattern equivalent to _parse_address, for vectorized parsing
+    _PARSE_RE = re.compile(
+        r'^(?P<street_number>\d+) (?P<street_name>.+?)'
+        r'(?: (?P<street_type>' + '|'.join(sorted(STREET_TYPE_ABBREVIATIONS)) + r'))?$'
+    )
+
     def __init__(self, db_connector: Optional[DatabaseConnector] = None):
         """
         Initialize address matcher.
@@ -25,8 +131,12 @@ class AddressMatcher:
             db_connector: Optional DatabaseConnector for parcel lookup
         """
         self.db_connector = db_connector
-        self.address_cache = {}
+        self.address_cache = _LRUCache(self.CACHE_SIZE)
+        self.candidate_cache = _LRUCache(self.CACHE_SIZE)  # Candidate rows by (street_number, street_name) block
         self.threshold = 70.0  # Default threshold for fuzzy matching (0-100)
+        self.scorer = fuzz.token_sort_ratio  # rapidfuzz scorer for candidate confidence
+        self.parcel_index = None  # Optional in-memory parcel rows by normalized address
+        self.parcel_index_keys = []
 
     def match_address(
         self,
@@ -51,10 +161,11 @@ class AddressMatcher:
         # Normalize address
         normalized_address = self._normalize_address(address)
 
-        # Check cache first
-        if normalized_address in self.address_cache:
-            logger.debug(f"Address cache hit for {normalized_address}")
-            return self.address_cache[normalized_address]
+        # Check cache first; results depend on the cutoff and result limit too
+        cache_key = (normalized_address, min_confidence, max_results)
+        if cache_key in self.address_cache:
+            logger.debug("Address cache hit for %s", normalized_address)
+            return self.address_cache[cache_key]
 
         # Look up in database if available
         if self.db_connector:
@@ -62,17 +173,84 @@ class AddressMatcher:
             parcel_matches = self._lookup_parcels_by_address(normalized_address, min_confidence, max_results)
 
             # Cache the results
-            self.address_cache[normalized_address] = parcel_matches
+            self.address_cache[cache_key] = parcel_matches
 
             return parcel_matches
         else:
             logger.warning("No database connector available for address matching")
             return []
 
-    def _normalize_address(self, address: str) -> str:
+    def match_addresses(
+        self,
+        addresses: List[str],
+        min_confidence: float = 70.0,
+        max_results: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Match a batch of addresses to parcels.
+
+        Candidates are fetched once per distinct uncached address, then every
+        (address, candidate) pair is scored in one parallel rapidfuzz call.
+
+        Args:
+            addresses: Address strings to match
+            min_confidence: Minimum confidence threshold (0-100)
+            max_results: Maximum number of results per address
+
+        Returns:
+            List of match lists, one per input address, in input order
+        """
+        normalized = [
+            self._normalize_address(address) if address and address.strip() else ''
+            for address in addresses
+        ]
+
+        if not self.db_connector:
+            logger.warning("No database connector available for address matching")
+            return [[] for _ in normalized]
+
+        # Results are collected locally; a batch larger than the bounded cache
+        # would otherwise evict its own early entries before they are returned
+        batch_matches = {}
+        pending = []
+        for address in dict.fromkeys(normalized):
+            if not address:
+                continue
+            cache_key = (address, min_confidence, max_results)
+            if cache_key in self.address_cache:
+                batch_matches[address] = self.address_cache[cache_key]
+            else:
+                pending.append(address)
+
+        # A loaded parcel index answers without the database
+        if self.parcel_index is not None:
+            for address in pending:
+                batch_matches[address] = self._extract_matches(
+                    address, self.parcel_index, self.parcel_index_keys, min_confidence, max_results
+                )
+                self.address_cache[(address, min_confidence, max_results)] = batch_matches[address]
+            return [batch_matches.get(address, []) for address in normalized]
+
+        try:
+            found = self._match_candidates(pending, min_confidence, max_results)
+            for address, matches in found.items():
+                batch_matches[address] = matches
+                self.address_cache[(address, min_confidence, max_results)] = matches
+
+        except Exception as e:
+            logger.error("Error matching address batch: %s", e)
+
+        return [batch_matches.get(address, []) for address in normalized]
+
+    @staticmethod
+    @lru_cache(maxsize=100000)
+    def _normalize_address(address: str) -> str:
         """
         Normalize address for consistent matching.
 
+        Normalization is pure, so results are memoized across all matcher
+        instances; permit and parcel data repeat the same addresses heavily.
+
         Args:
             address: Raw address string
 
@@ -82,80 +260,231 @@ class AddressMatcher:
         if not address:
             return ""
 
-        # Convert to uppercase
-        address = address.upper()
-
-        # Remove extra whitespace
-        address = re.sub(r'\s+', ' ', address.strip())
-
-        # Replace common abbreviations
-        abbrev_map = {
-            r'\bAVENUE\b': 'AVE',
-            r'\bAVE\b': 'AVE',
-            r'\bBOULEVARD\b': 'BLVD',
-            r'\bBLVD\b': 'BLVD',
-            r'\bCIRCLE\b': 'CIR',
-            r'\bCIR\b': 'CIR',
-            r'\bCOURT\b': 'CT',
-            r'\bCT\b': 'CT',
-            r'\bDRIVE\b': 'DR',
-            r'\bDR\b': 'DR',
-            r'\bEXPRESSWAY\b': 'EXPY',
-            r'\bEXPY\b': 'EXPY',
-            r'\bHIGHWAY\b': 'HWY',
-            r'\bHWY\b': 'HWY',
-            r'\bLANE\b': 'LN',
-            r'\bLN\b': 'LN',
-            r'\bPARKWAY\b': 'PKWY',
-            r'\bPKWY\b': 'PKWY',
-            r'\bPLACE\b': 'PL',
-            r'\bPL\b': 'PL',
-            r'\bROAD\b': 'RD',
-            r'\bRD\b': 'RD',
-            r'\bSQUARE\b': 'SQ',
-            r'\bSQ\b': 'SQ',
-            r'\bSTREET\b': 'ST',
-            r'\bST\b': 'ST',
-            r'\bTERRACE\b': 'TER',
-            r'\bTER\b': 'TER',
-            r'\bTRAIL\b': 'TRL',
-            r'\bTRL\b': 'TRL',
-            r'\bWAY\b': 'WAY',
-
-            # Directionals
-            r'\bNORTH\b': 'N',
-            r'\bSOUTH\b': 'S',
-            r'\bEAST\b': 'E',
-            r'\bWEST\b': 'W',
-            r'\bNORTHEAST\b': 'NE',
-            r'\bNORTHWEST\b': 'NW',
-            r'\bSOUTHEAST\b': 'SE',
-            r'\bSOUTHWEST\b': 'SW'
-        }
-
-        for pattern, replacement in abbrev_map.items():
-            address = re.sub(pattern, replacement, address)
+        # Convert to uppercase and drop everything after the first comma
+        # (city/state/zip suffix), which is never used for matching
+        address = address.upper().partition(',')[0]
 
         # Remove common noise tokens
-        noise_patterns = [
-            r'\bUNIT\s+\w+\b',
-            r'\bAPT\s+\w+\b',
-            r'\bBUILDING\s+\w+\b',
-            r'\bFLOOR\s+\w+\b',
-            r'#\w+',
-            r',.*'  # Remove everything after a comma
-        ]
+        address = _NOISE_RE.sub('', address)
+
+        # Turn special characters into spaces so hyphenated words still split
+        # into tokens ("MAIN-STREET" abbreviates like "MAIN STREET")
+        address = _SPECIAL_CHARS_RE.sub(' ', address)
+
+        # Abbreviate street types and directionals token by token; splitting
+        # also collapses whitespace
+        abbreviations = AddressMatcher._TOKEN_ABBREVIATIONS
+        address = ' '.join([abbreviations.get(token, token) for token in address.split()])
+
+        # Many raw spellings normalize to the same string; share one object
+        # across the caches and candidate lists
+        return sys.intern(address)
+
+    def _fetch_parcel_candidates(self, address: str) -> List[Tuple]:
+        """
+        Query the database for parcels that may match an address.
+
+        Args:
+            address: Normalized address string
+
+        Returns:
+            Candidate rows in PARCEL_COLUMNS order
+        """
+        try:
+            # Extract components for more targeted search
+            address_parts = self._parse_address(address)
+            street_number = address_parts.get('street_number', '')
+            street_name = address_parts.get('street_name', '')
+
+            # Addresses that differ only in street type or noise share a block
+            block_key = (street_number, street_name)
+            if block_key in self.candidate_cache:
+                return self.candidate_cache[block_key]
+
+            # Pick the fixed query text for the filters we have, so the server
+            # reuses one cached plan per shape
+            query = self._CANDIDATE_QUERIES[(bool(street_number), bool(street_name))]
+
+            params = []
+            if street_number:
+                params.append(street_number)
+
+            if street_name:
+                # Use LIKE for partial matching of street name
+                params.append(f"%{street_name}%")
+
+            # Execute query
+            results = self.db_connector.execute_query(query, tuple(params))
+
+            if results is None:
+                return []
+
+            self.candidate_cache[block_key] = results
 
-        for pattern in noise_patterns:
-            address = re.sub(pattern, '', address)
+            if not results:
+                logger.debug("No database matches found for address: %s", address)
 
-        # Remove special characters
-        address = re.sub(r'[^\w\s]', '', address)
+            return results
 
-        # Remove extra whitespace again
-        address = re.sub(r'\s+', ' ', address.strip())
+        except Exception as e:
+            logger.error("Error fetching parcel candidates: %s", e)
+            return []
 
-        return address
+    def _candidate_keys(self, results: List[Tuple]) -> Tuple[List[str], np.ndarray]:
+        """
+        Find the distinct normalized addresses among candidate rows.
+
+        Multi-unit parcels repeat the same street line, so each distinct
+        address only needs to be scored once.
+
+        Args:
+            results: Candidate rows in PARCEL_COLUMNS order
+
+        Returns:
+            Tuple of (distinct normalized addresses in first-seen order,
+            index into them for each row)
+        """
+        unique_index = {}
+        inverse = np.fromiter(
+            (unique_index.setdefault(self._normalize_address(row[1]), len(unique_index)) for row in results),
+            dtype=np.intp,
+            count=len(results)
+        )
+        return list(unique_index), inverse
+
+    def _match_candidates(
+        self,
+        addresses: List[str],
+        min_confidence: float,
+        max_results: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Match normalized addresses against their database candidates.
+
+        Exact hits are taken first. The remaining (address, candidate) pairs
+        are scored in one parallel rapidfuzz call, skipping addresses whose
+        exact hits already fill max_results.
+
+        Args:
+            addresses: Distinct normalized addresses
+            min_confidence: Minimum confidence threshold
+            max_results: Maximum number of results per address
+
+        Returns:
+            Dictionary mapping each address to its matches, best first
+        """
+        # The connector shares one cursor, so candidate queries run serially
+        batches = []
+        queries = []
+        choices = []
+        for address in addresses:
+            results = self._fetch_parcel_candidates(address)
+            keys, inverse = self._candidate_keys(results)
+            exact_rows, exact_score = self._exact_rows(address, keys, inverse, min_confidence)
+
+            # Only other addresses are scored, and only if slots remain
+            to_score = [i for i, key in enumerate(keys) if key != address] if len(exact_rows) < max_results else []
+            batches.append((address, results, keys, inverse, exact_rows, exact_score, to_score, len(choices)))
+            queries.extend([address] * len(to_score))
+            choices.extend(keys[i] for i in to_score)
+
+        # Score all pairs at once across all cores
+        pair_scores = process.cpdist(
+            queries, choices, scorer=self.scorer, dtype=np.float64, workers=-1
+        ) if choices else np.empty(0)
+
+        matches = {}
+        for address, results, keys, inverse, exact_rows, exact_score, to_score, offset in batches:
+            key_scores = np.full(len(keys), -np.inf)
+            key_scores[to_score] = pair_scores[offset:offset + len(to_score)]
+            matches[address] = self._select_matches(
+                results, inverse, key_scores, exact_rows, exact_score, min_confidence, max_results
+            )
+
+        return matches
+
+    def _exact_rows(
+        self,
+        address: str,
+        keys: List[str],
+        inverse: np.ndarray,
+        min_confidence: float
+    ) -> Tuple[np.ndarray, Optional[float]]:
+        """
+        Find candidate rows whose normalized address is the address itself.
+
+        Args:
+            address: Normalized address string
+            keys: Distinct normalized candidate addresses
+            inverse: Index into keys for each candidate row
+            min_confidence: Minimum confidence threshold
+
+        Returns:
+            Tuple of (exact row indices, the scorer's self-match score), or
+            no rows and None if there is no exact hit above min_confidence
+        """
+        if address not in keys:
+            return np.empty(0, dtype=np.intp), None
+
+        exact_score = float(self.scorer(address, address))
+        if exact_score < min_confidence:
+            return np.empty(0, dtype=np.intp), None
+
+        return np.flatnonzero(inverse == keys.index(address)), exact_score
+
+    def _select_matches(
+        self,
+        results: List[Tuple],
+        inverse: np.ndarray,
+        key_scores: np.ndarray,
+        exact_rows: np.ndarray,
+        exact_score: Optional[float],
+        min_confidence: float,
+        max_results: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Build result dictionaries for the best candidate rows.
+
+        Exact hits come first; the remaining slots go to the best-scoring
+        other rows above the threshold (ties keep query order).
+
+        Args:
+            results: Candidate rows in PARCEL_COLUMNS order
+            inverse: Index into key_scores for each row
+            key_scores: Confidence score for each distinct candidate address
+            exact_rows: Indices of rows that match the address exactly
+            exact_score: Confidence score for the exact rows
+            min_confidence: Minimum confidence threshold
+            max_results: Maximum number of results
+
+        Returns:
+            List of matching parcels with confidence scores, best first
+        """
+        matches = [self._build_match(results[idx], exact_score) for idx in exact_rows[:max_results]]
+
+        remaining = max_results - len(matches)
+        if remaining > 0:
+            scores = key_scores[inverse]
+            candidates = np.flatnonzero(scores >= min_confidence)
+            order = candidates[np.argsort(-scores[candidates], kind='stable')][:remaining]
+            matches.extend(self._build_match(results[idx], scores[idx]) for idx in order)
+
+        return matches
+
+    def _build_match(self, row: Tuple, score: float) -> Dict[str, Any]:
+        """
+        Build a result dictionary for a parcel row.
+
+        Args:
+            row: Parcel row in PARCEL_COLUMNS order
+            score: Confidence score for the row
+
+        Returns:
+            Parcel dictionary with a confidence score
+        """
+        match = dict(zip(self.PARCEL_COLUMNS, row))
+        match['confidence'] = float(score)
+        return match
 
     def _lookup_parcels_by_address(
         self,
@@ -175,16 +504,40 @@ class AddressMatcher:
             List of matching parcels with confidence scores
         """
         try:
+            if self.parcel_index is not None:
+                return self._extract_matches(
+                    address, self.parcel_index, self.parcel_index_keys, min_confidence, max_results
+                )
+
             if not self.db_connector:
                 return []
 
-            # Extract components for more targeted search
-            address_parts = self._parse_address(address)
-            street_number = address_parts.get('street_number', '')
-            street_name = address_parts.get('street_name', '')
+            # Same path as match_addresses, so both rank candidates identically
+            matches = self._match_candidates([address], min_confidence, max_results)[address]
+
+            logger.debug("Found %s matches for address: %s", len(matches), address)
+            return matches
+
+        except Exception as e:
+            logger.error("Error looking up parcels by address: %s", e)
+            return []
+
+    def load_parcel_index(self) -> bool:
+        """
+        Load every parcel address into memory for database-free matching.
+
+        Once loaded, lookups search all normalized parcel addresses with
+        rapidfuzz instead of querying candidates per address. Call again to
+        refresh after parcel data changes.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if not self.db_connector:
+                logger.warning("No database connector available to load parcel index")
+                return False
 
-            # Query database for potential matches
-            # This query will depend on the specific database schema
             query = """
             SELECT
                 pid,
@@ -197,73 +550,92 @@ class AddressMatcher:
                 zip_code
             FROM
                 parcel
-            WHERE
-                1=1
             """
 
-            params = []
+            results = self.db_connector.execute_query(query)
 
-            # Add filters if we have specific components
-            if street_number:
-                query += " AND street_number = ?"
-                params.append(street_number)
+            if results is None:
+                return False
 
-            if street_name:
-                # Use LIKE for partial matching of street name
-                query += " AND street_name LIKE ?"
-                params.append(f"%{street_name}%")
+            # Multi-unit parcels share a normalized address, so group rows by it
+            parcel_index = self._group_parcel_rows(results)
 
-            # Limit results for performance
-            query += " ORDER BY pid LIMIT 100"
+            self.parcel_index = parcel_index
+            self.parcel_index_keys = list(parcel_index)
 
-            # Execute query
-            results = self.db_connector.execute_query(query, tuple(params))
-
-            if not results:
-                logger.debug(f"No database matches found for address: {address}")
-                return []
+            # Cached matches came from the previous candidate source
+            self.clear_cache()
 
-            # Convert to list of dictionaries
-            parcels = []
-            for row in results:
-                parcel = {
-                    'pid': row[0],
-                    'full_address': row[1],
-                    'street_number': row[2],
-                    'street_name': row[3],
-                    'street_type': row[4],
-                    'city': row[5],
-                    'state': row[6],
-                    'zip_code': row[7]
-                }
-                parcels.append(parcel)
-
-            # Perform fuzzy matching
-            matches = []
-            for parcel in parcels:
-                # Normalize database address for comparison
-                db_address = self._normalize_address(parcel['full_address'])
-
-                # Calculate fuzzy match score
-                score = fuzz.token_sort_ratio(address, db_address)
-
-                if score >= min_confidence:
-                    match = parcel.copy()
-                    match['confidence'] = score
-                    matches.append(match)
-
-            # Sort by confidence (descending)
-            matches = sorted(matches, key=lambda x: x['confidence'], reverse=True)
-
-            # Limit results
-            matches = matches[:max_results]
-
-            logger.debug(f"Found {len(matches)} matches for address: {address}")
-            return matches
+            logger.info("Loaded parcel index with %s parcels", len(results))
+            return True
 
         except Exception as e:
-            logger.error(f"Error looking up parcels by address: {str(e)}")
-            return []
+            logger.error("Error loading parcel index: %s", e)
+            return False
+
+    def _group_parcel_rows(self, results: List[Tuple]) -> Dict[str, List[Tuple]]:
+        """
+        Group parcel rows by normalized address.
+
+        Args:
+            results: Parcel rows in PARCEL_COLUMNS order
+
+        Returns:
+            Dictionary mapping normalized address to its parcel rows
+        """
+        parcel_groups = {}
+        for row in results:
+            parcel_groups.setdefault(self._normalize_address(row[1]), []).append(row)
+
+        return parcel_groups
+
+    def _extract_matches(
+        self,
+        address: str,
+        parcel_groups: Dict[str, List[Tuple]],
+        keys: List[str],
+        min_confidence: float,
+        max_results: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the best-scoring parcel groups for an address.
+
+        Rows filed under the address itself are returned first, and rapidfuzz
+        only searches for the remaining slots, applying the cutoff and top-k
+        selection itself.
+
+        Args:
+            address: Normalized address string
+            parcel_groups: Parcel rows by normalized address
+            keys: Normalized addresses to search (the keys of parcel_groups)
+            min_confidence: Minimum confidence threshold
+            max_results: Maximum number of results
+
+        Returns:
+            List of matching parcels with confidence scores, best first
+        """
+        matches = []
+        exact = parcel_groups.get(address)
+        if exact:
+            exact_score = float(self.scorer(address, address))
+            if exact_score >= min_confidence:
+                matches = [self._build_match(row, exact_score) for row in exact[:max_results]]
+
+        remaining = max_results - len(matches)
+        if remaining > 0:
+            # The exact key may be among the hits, so ask for one more
+            hits = process.extract(
+                address,
+                keys,
+                scorer=self.scorer,
+                limit=remaining + 1 if exact else remaining,
+                score_cutoff=min_confidence
+            )
+            for key, score, _ in hits:
+                if key != address:
+                    matches.extend(self._build_match(row, score) for row in parcel_groups[key])
+
+        return matches[:max_results]
 
     def _parse_address(self, address: str) -> Dict[str, str]:
         """
@@ -285,22 +657,45 @@ class AddressMatcher:
         }
 
         # Simple parsing - extract street number and name
-        match = re.match(r'^(\d+)\s+(.+)$', address)
-        if match:
-            components['street_number'] = match.group(1)
-            components['street_name'] = match.group(2)
+        street_number, _, street_name = address.partition(' ')
+        if street_number.isdigit() and street_name:
+            components['street_number'] = street_number
+            components['street_name'] = street_name
+
+            # Try to extract street type from the last token
+            name, _, last_part = street_name.rpartition(' ')
+            if name and last_part in self.STREET_TYPE_ABBREVIATIONS:
+                components['street_type'] = last_part
+                components['street_name'] = name
+
+        return components
+
+    def parse_addresses(self, addresses: pd.Series) -> pd.DataFrame:
+        """
+        Parse a Series of normalized addresses into components.
+
+        Vectorized equivalent of _parse_address: the whole Series is
+        parsed with one str.extract call instead of a Python loop.
+
+        Args:
+            addresses: Series of normalized address strings
+
+        Returns:
+            DataFrame of address components, indexed like the input
+        """
+        components = addresses.astype(str).str.extract(self._PARSE_RE)
 
-            # Try to extract street type
-            name_parts = components['street_name'].split()
-            if len(name_parts) > 1 and name_parts[-1] in ['AVE', 'BLVD', 'CIR', 'CT', 'DR', 'EXPY', 'HWY', 'LN', 'PKWY', 'PL', 'RD', 'SQ', 'ST', 'TER', 'TRL', 'WAY']:
-                components['street_type'] = name_parts[-1]
-                components['street_name'] = ' '.join(name_parts[:-1])
+        # Mirror _parse_address: unparsed parts are empty strings
+        components = components.fillna('')
+        for column in ['city', 'state', 'zip_code']:
+            components[column] = ''
 
         return components
 
     def clear_cache(self) -> None:
-        """Clear the address cache."""
-        self.address_cache = {}
+        """Clear the address and candidate caches."""
+        self.address_cache = _LRUCache(self.CACHE_SIZE)
+        self.candidate_cache = _LRUCache(self.CACHE_SIZE)
         logger.debug("Address cache cleared")
 
     def set_threshold(self, threshold: float) -> None:
@@ -313,4 +708,4 @@ class AddressMatcher:
         if 0 <= threshold <= 100:
             self.threshold = threshold
         else:
-            logger.warning(f"Invalid threshold value: {threshold}. Must be between 0 and 100.")
\ No newline at end of file
+            logger.warning("Invalid threshold value: %s. Must be between 0 and 100.", threshold)
\ No newline at end of file
@@ -10,12 +10,13 @@ import os
 import sys
 import json
 import logging
+import queue
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from pathlib import Path
 
-import pandas as pd
 from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Query, Form, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -26,7 +27,7 @@ from data_bridge.config_manager import ConfigManager
 from data_bridge.permit_parser import PermitParser
 from data_bridge.personal_property_parser import PersonalPropertyParser
 from data_bridge.db_connector import DatabaseConnector, PACSConnector
-from data_bridge.address_matcher import AddressMatcher, Address
+from data_bridge.address_matcher import AddressMatcher
 
 # Configure logging
 logging.basicConfig(
@@ -87,31 +88,87 @@ class StatusResponse(BaseModel):
     database_connected: bool
     config_loaded: bool
 
-# Dependency to get database connector
-async def get_db_connector():
+# Configuration shared by all requests, loaded on first use
+_config: Optional[ConfigManager] = None
+
+# Maximum idle PACS connectors kept open between requests
+PACS_POOL_SIZE = 10
+
+# Idle PACS connectors. Each request checks one out for its own use, since a
+# connector has a single pyodbc cursor and is not safe to share concurrently
+_pacs_pool: "queue.Queue[PACSConnector]" = queue.Queue(maxsize=PACS_POOL_SIZE)
+
+# Dependency to get configuration
+def get_config() -> ConfigManager:
     """
-    Get a database connector as a dependency.
+    Get the shared configuration manager as a dependency.
+    """
+    global _config
+    
+    if _config is None:
+        _config = ConfigManager()
+    
+    return _config
+
+def _checkout_pacs_connector(pool: queue.Queue) -> Optional[PACSConnector]:
     """
-    config = ConfigManager()
+    Take an idle PACS connector from the pool, creating one if none is idle.
+    """
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        pass
+    
+    config = get_config()
     pacs_config = config.get('database', 'pacs')
     
     if not pacs_config:
         return None
     
-    connector = PACSConnector(
+    return PACSConnector(
         server=pacs_config.get('server', 'localhost'),
         database=pacs_config.get('database', 'PACS'),
         username=pacs_config.get('username', ''),
         password=pacs_config.get('password', ''),
         trusted_connection=pacs_config.get('trusted_connection', True)
     )
+
+def _release_pacs_connector(pool: queue.Queue, connector: PACSConnector) -> None:
+    """
+    Return a connector to its pool, or close it if the pool has been replaced
+    or already holds PACS_POOL_SIZE idle connectors.
+    """
+    if pool is _pacs_pool:
+        try:
+            pool.put_nowait(connector)
+            return
+        except queue.Full:
+            pass
+    
+    connector.disconnect()
+
+# Dependency to get database connector
+async def get_db_connector() -> AsyncIterator[Optional[PACSConnector]]:
+    """
+    Get a database connector as a dependency.
+    
+    The connector is checked out of the pool for the duration of the request
+    and returned afterwards, so connections are reused but never shared by
+    two requests at once. The liveness check and any reconnect run off the
+    event loop since pyodbc blocks.
+    """
+    pool = _pacs_pool
+    connector = _checkout_pacs_connector(pool)
     
-    # Test connection
-    if connector.connect():
-        yield connector
-        connector.disconnect()
-    else:
+    if not connector:
         yield None
+        return
+    
+    try:
+        connected = await run_in_threadpool(lambda: connector.is_connected() or connector.connect())
+        yield connector if connected else None
+    finally:
+        _release_pacs_connector(pool, connector)
 
 # Dependency to get address matcher
 async def get_address_matcher(db_connector: Optional[PACSConnector] = Depends(get_db_connector)):
@@ -122,35 +179,17 @@ async def get_address_matcher(db_connector: Optional[PACSConnector] = Depends(ge
 
 # API routes
 @app.get("/", tags=["General"])
-async def root():
+async def root(
+    config: ConfigManager = Depends(get_config),
+    db_connector: Optional[PACSConnector] = Depends(get_db_connector)
+):
     """Get API status and information."""
-    config = ConfigManager()
-    
-    # Test database connection
-    db_connected = False
-    db_connector = None
-    
-    try:
-        pacs_config = config.get('database', 'pacs')
-        if pacs_config:
-            db_connector = PACSConnector(
-                server=pacs_config.get('server', 'localhost'),
-                database=pacs_config.get('database', 'PACS'),
-                username=pacs_config.get('username', ''),
-                password=pacs_config.get('password', ''),
-                trusted_connection=pacs_config.get('trusted_connection', True)
-            )
-            db_connected = db_connector.connect()
-            if db_connected:
-                db_connector.disconnect()
-    except Exception as e:
-        logger.error(f"Error testing database connection: {str(e)}")
     
     return StatusResponse(
         status="ok",
         version=__version__,
-        database_connected=db_connected,
-        config_loaded=config.config_file.exists()
+        database_connected=db_connector is not None,
+        config_loaded=config.config_path.exists()
     )
 
 @app.post("/api/import/permits", response_model=ImportResult, tags=["Import"])
@@ -177,11 +216,12 @@ async def import_permits(
         # Count validation errors
         error_count = 0
         if 'validation_errors' in df.columns:
-            error_count = df['validation_errors'].apply(lambda x: x != '' and not pd.isna(x)).sum()
+            errors = df['validation_errors']
+            error_count = int((errors.notna() & (errors != '')).sum())
         
-        # Save to output file
+        # Save to output file after the response is sent, in bounded chunks
         output_path = f"processed_permits_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(output_path, index=False)
+        background_tasks.add_task(df.to_csv, output_path, index=False, chunksize=10000)
         
         # Prepare sample record
         sample_record = None
@@ -230,11 +270,12 @@ async def import_personal_property(
         # Count validation errors
         error_count = 0
         if 'validation_errors' in df.columns:
-            error_count = df['validation_errors'].apply(lambda x: x != '' and not pd.isna(x)).sum()
+            errors = df['validation_errors']
+            error_count = int((errors.notna() & (errors != '')).sum())
         
-        # Save to output file
+        # Save to output file after the response is sent, in bounded chunks
         output_path = f"processed_property_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(output_path, index=False)
+        background_tasks.add_task(df.to_csv, output_path, index=False, chunksize=10000)
         
         # Prepare sample record
         sample_record = None
@@ -332,13 +373,13 @@ async def match_address(
 
 @app.get("/api/config/{section}", tags=["Configuration"])
 async def get_config_section(
-    section: str
+    section: str,
+    config: ConfigManager = Depends(get_config)
 ):
     """
     Get a configuration section.
     """
     try:
-        config = ConfigManager()
         section_data = config.get(section)
         
         if section_data is None:
@@ -352,20 +393,27 @@ async def get_config_section(
 
 @app.post("/api/config", tags=["Configuration"])
 async def set_config_item(
-    item: ConfigItem
+    item: ConfigItem,
+    config: ConfigManager = Depends(get_config)
 ):
     """
     Set a configuration item.
     """
+    global _pacs_pool
+    
     try:
-        config = ConfigManager()
-        result = config.set(item.section, item.key, item.value)
+        config.set(item.section, item.key, item.value)
         
-        if not result:
+        # Save the configuration
+        if not config.save_config():
             raise HTTPException(status_code=500, detail=f"Failed to set configuration item: {item.section}.{item.key}")
         
-        # Save the configuration
-        config.save_config()
+        # Start a fresh pool if the connection settings changed; connectors
+        # still checked out are closed when their requests finish
+        if item.section == 'database':
+            old_pool, _pacs_pool = _pacs_pool, queue.Queue(maxsize=PACS_POOL_SIZE)
+            while not old_pool.empty():
+                old_pool.get_nowait().disconnect()
         
         return {"status": "success", "message": f"Configuration item {item.section}.{item.key} set successfully"}
     
@@ -2,17 +2,21 @@ import argparse
 import logging
 import sys
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-
-import pandas as pd
+from typing import Dict, Iterable, Iterator, List, Optional, Union, Any, TYPE_CHECKING
 
 from .config_manager import ConfigManager
-from .db_connector import DatabaseConnector
-from .permit_parser import PermitParser
-from .personal_property_parser import PersonalPropertyParser
-from .address_matcher import AddressMatcher
+
+# pandas, the parsers and the database connector are imported where they are
+# used, so commands like 'version' and 'config' start without loading them
+if TYPE_CHECKING:
+    import pandas as pd
+    from .db_connector import PACSConnector
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -20,6 +24,60 @@ logger = logging.getLogger(__name__)
 # Version
 __version__ = "1.0.0"
 
+# PACS connectors shared across CLI instances, keyed by connection settings
+_pacs_connectors: Dict[tuple, 'PACSConnector'] = {}
+
+
+def _get_pacs_connector(pacs_config: Dict[str, Any]) -> Optional['PACSConnector']:
+    """
+    Get a connected PACS connector, reusing an open connection if possible.
+
+    Args:
+        pacs_config: PACS database configuration section
+
+    Returns:
+        Connected PACSConnector, or None if the connection failed
+    """
+    from .db_connector import PACSConnector
+
+    key = tuple(sorted((k, str(v)) for k, v in pacs_config.items()))
+    connector = _pacs_connectors.get(key)
+
+    if connector is None:
+        connector = PACSConnector(
+            server=pacs_config.get('server', 'localhost'),
+            database=pacs_config.get('database', 'PACS'),
+            username=pacs_config.get('username', ''),
+            password=pacs_config.get('password', ''),
+            trusted_connection=pacs_config.get('trusted_connection', True)
+        )
+        _pacs_connectors[key] = connector
+
+    if connector.is_connected() or connector.connect():
+        return connector
+
+    return None
+
+
+def _parse_file_worker(parser_class: type, file_path: str, sheet_name: Optional[str], engine: str) -> 'pd.DataFrame':
+    """
+    Parse one file in a worker process.
+
+    Parcel matching needs the parent's database connection, so the worker
+    parser has no address matcher and matching is left to the caller.
+
+    Args:
+        parser_class: PermitParser or PersonalPropertyParser
+        file_path: Path to the data file
+        sheet_name: Sheet name for Excel files
+        engine: CSV reader to use
+
+    Returns:
+        DataFrame with cleaned and validated records
+    """
+    return parser_class().parse_file(file_path, sheet_name=sheet_name, engine=engine)
+
+
 class DataBridgeCLI:
     """Command-line interface for the PACS DataBridge system."""
 
@@ -44,103 +102,132 @@ class DataBridgeCLI:
                 logger.error("No PACS database configuration found")
                 return False
 
-            # Connect to PACS database
-            self.db_connector = DatabaseConnector(
-                server=pacs_config.get('server', 'localhost'),
-                database=pacs_config.get('database', 'PACS'),
-                username=pacs_config.get('username', ''),
-                password=pacs_config.get('password', ''),
-                trusted_connection=pacs_config.get('trusted_connection', True)
-            )
-
-            if not self.db_connector.connect():
+            # Connect to PACS database, reusing an open connection
+            db_connector = _get_pacs_connector(pacs_config)
+            if not db_connector:
                 logger.error("Failed to connect to PACS database")
                 return False
 
             # Initialize address matcher with database connector
-            self.address_matcher = AddressMatcher(self.db_connector)
+            if db_connector is not self.db_connector or not self.address_matcher:
+                from .address_matcher import AddressMatcher
+
+                self.db_connector = db_connector
+                self.address_matcher = AddressMatcher(self.db_connector)
 
             logger.info("Database connections established successfully")
             return True
 
         except Exception as e:
-            logger.error(f"Error setting up connections: {str(e)}")
+            logger.error("Error setting up connections: %s", e)
             return False
 
-    def import_permits(self, file_path: str, format_type: str = None, sheet_name: str = None) -> bool:
+    def import_permits(
+        self,
+        file_path: Union[str, List[str]],
+        format_type: str = None,
+        sheet_name: str = None,
+        chunksize: int = 50000
+    ) -> bool:
         """
-        Import permit data from a file.
+        Import permit data from one or more files.
+
+        Multiple files are parsed in parallel and combined into one output file.
 
         Args:
-            file_path: Path to the permit data file
+            file_path: Path to the permit data file, or a list of paths
             format_type: Optional file format override
             sheet_name: Sheet name for Excel files
+            chunksize: Number of CSV rows parsed and written at a time
 
         Returns:
             True if import was successful, False otherwise
         """
         try:
-            logger.info(f"Importing permits from {file_path}")
+            file_paths = [file_path] if isinstance(file_path, (str, Path)) else list(file_path)
+            logger.info("Importing permits from %s", ', '.join(map(str, file_paths)))
 
             # Initialize permit parser
+            from .permit_parser import PermitParser
+
             self.parser = PermitParser(address_matcher=self.address_matcher)
 
-            # Parse the file
-            df = self.parser.parse_file(file_path, sheet_name=sheet_name)
+            # Parse the file in chunks, appending each to the output file
+            output_path = self._output_path('processed_permits')
+            engine = self.config.get('import', 'engine') or 'pandas'
+            if len(file_paths) > 1:
+                chunks = self._parse_files_parallel(self.parser, file_paths, sheet_name, engine, chunksize)
+            else:
+                chunks = self.parser.parse_file_iter(
+                    file_paths[0], sheet_name=sheet_name, chunksize=chunksize, engine=engine
+                )
+            stats = self._write_import_chunks(chunks, output_path)
 
             # Process results
-            logger.info(f"Successfully parsed {len(df)} permit records")
+            logger.info("Successfully parsed %s permit records", stats['total'])
+            logger.info("Saved processed data to %s", output_path)
 
             # Display statistics
-            self._display_import_stats(df, 'permit')
-
-            # Save to output file if needed
-            output_path = f"processed_permits_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            df.to_csv(output_path, index=False)
-            logger.info(f"Saved processed data to {output_path}")
+            self._display_import_stats(stats, 'permit')
 
             return True
 
         except Exception as e:
-            logger.error(f"Error importing permits: {str(e)}")
+            logger.error("Error importing permits: %s", e)
             return False
 
-    def import_personal_property(self, file_path: str, format_type: str = None, sheet_name: str = None) -> bool:
+    def import_personal_property(
+        self,
+        file_path: Union[str, List[str]],
+        format_type: str = None,
+        sheet_name: str = None,
+        chunksize: int = 50000
+    ) -> bool:
         """
-        Import personal property data from a file.
+        Import personal property data from one or more files.
+
+        Multiple files are parsed in parallel and combined into one output file.
 
         Args:
-            file_path: Path to the personal property data file
+            file_path: Path to the personal property data file, or a list of paths
             format_type: Optional file format override
             sheet_name: Sheet name for Excel files
+            chunksize: Number of CSV rows parsed and written at a time
 
         Returns:
             True if import was successful, False otherwise
         """
         try:
-            logger.info(f"Importing personal property data from {file_path}")
+            file_paths = [file_path] if isinstance(file_path, (str, Path)) else list(file_path)
+            logger.info("Importing personal property data from %s", ', '.join(map(str, file_paths)))
 
             # Initialize personal property parser
+            from .personal_property_parser import PersonalPropertyParser
+
             pp_parser = PersonalPropertyParser(address_matcher=self.address_matcher)
 
-            # Parse the file
-            df = pp_parser.parse_file(file_path, sheet_name=sheet_name, skip_rows=0)
+            # Parse the file in chunks, appending each to the output file
+            output_path = self._output_path('processed_property')
+            engine = self.config.get('import', 'engine') or 'pandas'
+            if len(file_paths) > 1:
+                chunks = self._parse_files_parallel(pp_parser, file_paths, sheet_name, engine, chunksize)
+            else:
+                chunks = pp_parser.parse_file_iter(
+                    file_paths[0], sheet_name=sheet_name, skip_rows=0, chunksize=chunksize, engine=engine
+                )
+            stats = self._write_import_chunks(chunks, output_path)
 
             # Process results
-            logger.info(f"Successfully parsed {len(df)} personal property records")
+            logger.info("Successfully parsed %s personal property records", stats['total'])
+            logger.info("Saved processed data to %s", output_path)
 
             # Display statistics
-            self._display_import_stats(df, 'personal property')
-
-            # Save to output file if needed
-            output_path = f"processed_property_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            df.to_csv(output_path, index=False)
-            logger.info(f"Saved processed data to {output_path}")
+            self._display_import_stats(stats, 'personal property')
 
             return True
 
         except Exception as e:
-            logger.error(f"Error importing personal property: {str(e)}")
+            logger.error("Error importing personal property: %s", e)
             return False
 
     def lookup_parcel(self, address: str) -> bool:
@@ -159,29 +246,31 @@ class DataBridgeCLI:
                     logger.error("Could not set up database connection for parcel lookup")
                     return False
 
-            logger.info(f"Looking up parcel for address: {address}")
-
-            # Get matching parcels
-            parcels = self.db_connector.get_parcel_by_address(address)
-
-            if not parcels:
+            logger.info("Looking up parcel for address: %s", address)
+
+            # Display matching parcels as they are fetched
+            count = 0
+            for count, parcel in enumerate(self.db_connector.get_parcel_by_address_iter(address), 1):
+                lines = ["", "Matching parcels:", "-" * 80] if count == 1 else []
+                lines.extend([
+                    f"{count}. {parcel.get('address') or 'Unknown address'}",
+                    f"   Parcel ID: {parcel.get('parcel_number') or parcel.get('parcel_id', 'Unknown')}",
+                    f"   Location: {parcel.get('city') or ''}, {parcel.get('state') or ''}",
+                    "-" * 80
+                ])
+                sys.stdout.write('\n'.join(lines) + '\n')
+
+            if not count:
                 logger.info("No matching parcels found")
                 print("No matching parcels found")
                 return True
 
-            # Display results
-            print(f"\nFound {len(parcels)} matching parcels:")
-            print("-" * 80)
-            for i, parcel in enumerate(parcels):
-                print(f"{i+1}. {parcel.get('full_address', 'Unknown address')}")
-                print(f"   Parcel ID: {parcel.get('pid', 'Unknown')}")
-                print(f"   Location: {parcel.get('city', '')}, {parcel.get('state', '')}")
-                print("-" * 80)
+            print(f"Found {count} matching parcels")
 
             return True
 
         except Exception as e:
-            logger.error(f"Error looking up parcel: {str(e)}")
+            logger.error("Error looking up parcel: %s", e)
             return False
 
     def setup_config(self, ciaps_config_file: str = None) -> bool:
@@ -196,42 +285,42 @@ class DataBridgeCLI:
         """
         try:
             if ciaps_config_file:
-                logger.info(f"Importing configuration from CIAPS file: {ciaps_config_file}")
+                logger.info("Importing configuration from CIAPS file: %s", ciaps_config_file)
                 if not self.config.setup_from_ciaps(ciaps_config_file):
                     logger.error("Failed to import CIAPS configuration")
                     return False
                 logger.info("Successfully imported CIAPS configuration")
 
             # Display current configuration
-            print("\nCurrent Configuration:")
-            print("-" * 80)
+            lines = ["", "Current Configuration:", "-" * 80]
 
             # Database configuration
             db_config = self.config.get('database', 'pacs')
             if db_config:
-                print("PACS Database:")
-                print(f"  Server: {db_config.get('server', 'Not set')}")
-                print(f"  Database: {db_config.get('database', 'Not set')}")
-                print(f"  Authentication: {'Windows' if db_config.get('trusted_connection', True) else 'SQL Server'}")
+                lines.append("PACS Database:")
+                lines.append(f"  Server: {db_config.get('server', 'Not set')}")
+                lines.append(f"  Database: {db_config.get('database', 'Not set')}")
+                lines.append(f"  Authentication: {'Windows' if db_config.get('trusted_connection', True) else 'SQL Server'}")
 
             # Import folder configuration
             import_config = self.config.get('import')
             if import_config:
-                print("\nImport Settings:")
+                lines.extend(["", "Import Settings:"])
                 if 'permit' in import_config:
-                    print(f"  Permit Watch Folder: {import_config['permit'].get('watch_folder', 'Not set')}")
-                    print(f"  Permit Archive Folder: {import_config['permit'].get('archive_folder', 'Not set')}")
+                    lines.append(f"  Permit Watch Folder: {import_config['permit'].get('watch_folder', 'Not set')}")
+                    lines.append(f"  Permit Archive Folder: {import_config['permit'].get('archive_folder', 'Not set')}")
                 if 'personal_property' in import_config:
-                    print(f"  Personal Property Watch Folder: {import_config['personal_property'].get('watch_folder', 'Not set')}")
-                    print(f"  Personal Property Archive Folder: {import_config['personal_property'].get('archive_folder', 'Not set')}")
+                    lines.append(f"  Personal Property Watch Folder: {import_config['personal_property'].get('watch_folder', 'Not set')}")
+                    lines.append(f"  Personal Property Archive Folder: {import_config['personal_property'].get('archive_folder', 'Not set')}")
 
-            print("-" * 80)
-            print("Configuration file location:", self.config.config_path)
+            lines.append("-" * 80)
+            lines.append(f"Configuration file location: {self.config.config_path}")
+            sys.stdout.write("\n".join(lines) + "\n")
 
             return True
 
         except Exception as e:
-            logger.error(f"Error setting up configuration: {str(e)}")
+            logger.error("Error setting up configuration: %s", e)
             return False
 
     def test_connection(self) -> bool:
@@ -265,48 +354,231 @@ class DataBridgeCLI:
                 return False
 
         except Exception as e:
-            logger.error(f"Error testing database connection: {str(e)}")
+            logger.error("Error testing database connection: %s", e)
+            return False
+
+    def _output_path(self, prefix: str) -> Path:
+        """
+        Build a timestamped output file path.
+
+        Files go to the configured export folder when it exists, otherwise to
+        the current directory.
+
+        Args:
+            prefix: File name prefix
+
+        Returns:
+            Path to the output CSV file
+        """
+        output_folder = Path(self.config.get('export', 'output_folder') or '.')
+        if not output_folder.is_dir():
+            output_folder = Path('.')
+
+        return output_folder / f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    def _parse_files_parallel(
+        self,
+        parser: Any,
+        file_paths: List[str],
+        sheet_name: Optional[str],
+        engine: str,
+        chunksize: int
+    ) -> Iterator['pd.DataFrame']:
+        """
+        Parse several files in worker processes, one file per task.
+
+        Workers parse each file whole, so ``chunksize`` does not bound how
+        much of a file is read at once. At most one file per worker is in
+        flight, so the parent holds only that many parsed files. Parcel
+        matching runs here in the parent process, which owns the database
+        connection, and each file is matched and yielded in ``chunksize``-row
+        slices.
+
+        Args:
+            parser: Parser whose class is used in the workers and whose address
+                matcher is used for parcel matching
+            file_paths: Paths to the data files
+            sheet_name: Sheet name for Excel files
+            engine: CSV reader to use
+            chunksize: Number of rows matched and yielded at a time
+
+        Yields:
+            DataFrames of parsed records, in input file order
+        """
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        logger.info(
+            "Parsing %s files in %s worker processes; each file is read whole, "
+            "chunksize applies to matching and writing only", len(file_paths), max_workers
+        )
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            remaining = iter(file_paths)
+            in_flight = deque(
+                executor.submit(_parse_file_worker, type(parser), file_path, sheet_name, engine)
+                for file_path in islice(remaining, max_workers)
+            )
+
+            while in_flight:
+                df = in_flight.popleft().result()
+
+                # Keep every worker busy with the next file
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    in_flight.append(executor.submit(_parse_file_worker, type(parser), next_path, sheet_name, engine))
+
+                if len(df) <= chunksize:
+                    yield parser.match_parcels(df)
+                    continue
+
+                for start in range(0, len(df), chunksize):
+                    yield parser.match_parcels(df.iloc[start:start + chunksize].copy())
+
+    def _write_import_chunks(self, chunks: Iterable['pd.DataFrame'], output_path: Path) -> Dict[str, Any]:
+        """
+        Write parsed chunks to a CSV file and collect import statistics.
+
+        Only one chunk is held in memory at a time; statistics are accumulated
+        as running counts so the full dataset is never retained. Every chunk
+        is written in the first chunk's column order; missing columns are
+        left empty and extra columns are dropped.
+
+        Args:
+            chunks: Iterable of parsed DataFrames
+            output_path: Path to the output CSV file
+
+        Returns:
+            Dictionary with total, error_count, non_null counts and the populated
+            fields of a sample record
+        """
+        stats = {'total': 0, 'error_count': None, 'non_null': {}, 'sample': None}
+
+        # Pick one writer for the whole file so quoting never changes midway
+        fast_writer = bool(self.config.get('export', 'fast_writer')) and self._fast_writer_available()
+        first = True
+        columns = None
+
+        for chunk in chunks:
+            # Frames from different input files can have other or reordered
+            # columns; align them to the header written with the first chunk
+            if columns is None:
+                columns = chunk.columns
+            elif not chunk.columns.equals(columns):
+                dropped = chunk.columns.difference(columns)
+                if len(dropped) > 0:
+                    logger.warning("Dropping columns not in the output header: %s", ', '.join(map(str, dropped)))
+                chunk = chunk.reindex(columns=columns)
+
+            if fast_writer:
+                self._write_csv_fast(chunk, output_path, header=first)
+            else:
+                chunk.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+            first = False
+
+            stats['total'] += len(chunk)
+
+            # Count validation errors
+            if 'validation_errors' in chunk.columns:
+                errors = chunk['validation_errors']
+                error_count = int((errors.notna() & (errors != '')).sum())
+                stats['error_count'] = (stats['error_count'] or 0) + error_count
+
+            # Count populated values per field
+            for col, non_null in chunk.notna().sum().items():
+                stats['non_null'][col] = stats['non_null'].get(col, 0) + int(non_null)
+
+            # Keep the first record as a sample
+            if stats['sample'] is None and len(chunk) > 0:
+                stats['sample'] = chunk.iloc[0].dropna()
+
+        return stats
+
+    def _fast_writer_available(self) -> bool:
+        """
+        Check whether the PyArrow CSV writer can be used.
+
+        Returns:
+            True if PyArrow is installed, False otherwise
+        """
+        try:
+            import pyarrow.csv  # noqa: F401
+            return True
+        except ImportError:
+            logger.warning("pyarrow is not installed, falling back to pandas CSV writer")
             return False
 
-    def _display_import_stats(self, df: pd.DataFrame, import_type: str) -> None:
+    def _write_csv_fast(self, df: 'pd.DataFrame', output_path: Path, header: bool = True) -> None:
+        """
+        Write a DataFrame to CSV with the PyArrow writer.
+
+        Enabled by the ``export.fast_writer`` setting. Output is not
+        byte-identical to pandas (strings are quoted), so it is opt-in.
+        Errors are raised rather than handled, since switching writers
+        partway through a file would mix CSV styles.
+
+        Args:
+            df: DataFrame to write
+            output_path: Path to the output CSV file
+            header: Whether to start a new file with a header row
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pac
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with open(output_path, 'wb' if header else 'ab') as f:
+            pac.write_csv(table, f, write_options=pac.WriteOptions(include_header=header))
+
+    def _display_import_stats(self, stats: Dict[str, Any], import_type: str) -> None:
         """
         Display statistics for an imported dataset.
 
         Args:
-            df: DataFrame containing the imported data
+            stats: Statistics collected by _write_import_chunks
             import_type: Type of data ('permit' or 'personal property')
         """
-        print("\nImport Statistics:")
-        print("-" * 80)
-        print(f"Total {import_type} records: {len(df)}")
+        total = stats['total']
+
+        # Collect the report and write it in one call
+        lines = ["", "Import Statistics:", "-" * 80, f"Total {import_type} records: {total}"]
 
         # Count validation errors
-        if 'validation_errors' in df.columns:
-            error_count = df['validation_errors'].apply(lambda x: x != '' and not pd.isna(x)).sum()
-            print(f"Records with validation errors: {error_count}")
-            print(f"Valid records: {len(df) - error_count}")
+        if stats['error_count'] is not None:
+            error_count = stats['error_count']
+            lines.append(f"Records with validation errors: {error_count}")
+            lines.append(f"Valid records: {total - error_count}")
 
         # Show fields mapped
-        print(f"\nFields mapped:")
-        for col in df.columns:
-            non_null = df[col].count()
-            print(f"  {col}: {non_null} values ({non_null/len(df)*100:.1f}% populated)")
+        lines.extend(["", "Fields mapped:"])
+        for col, non_null in stats['non_null'].items():
+            lines.append(f"  {col}: {non_null} values ({non_null/total*100:.1f}% populated)")
 
         # Display sample data
-        if len(df) > 0:
-            print("\nSample record:")
-            print("-" * 80)
-            sample = df.iloc[0].to_dict()
-            for key, value in sample.items():
-                if key != 'validation_errors' and not pd.isna(value) and value != '':
-                    print(f"  {key}: {value}")
+        if stats['sample'] is not None:
+            lines.extend(["", "Sample record:", "-" * 80])
+            for key, value in stats['sample'].items():
+                if key != 'validation_errors' and value != '':
+                    lines.append(f"  {key}: {value}")
 
-        print("-" * 80)
+        lines.append("-" * 80)
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 
-def cli_main():
-    """Main entry point for the command-line interface."""
-    # Set up argument parser
+def _print_version(cli: DataBridgeCLI, args: argparse.Namespace) -> None:
+    """Print version information."""
+    print(f"PACS DataBridge v{__version__}")
+    print("A modern, AI-enhanced data import/export system for PACS TrueAutomation")
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    The parser is built once and reused by later cli_main() calls. Each
+    subcommand stores its handler as the 'func' default.
+
+    Returns:
+        Configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         description=f"PACS DataBridge CLI v{__version__}",
         epilog="A modern, AI-enhanced data import/export system for PACS TrueAutomation"
@@ -317,52 +589,53 @@ def cli_main():
 
     # Import permits command
     import_parser = subparsers.add_parser('import-permits', help='Import building permit data')
-    import_parser.add_argument('file', help='Path to the permit data file')
+    import_parser.add_argument('file', nargs='+', help='Path(s) to the permit data file(s)')
     import_parser.add_argument('--format', help='File format (csv, xlsx, etc.)')
     import_parser.add_argument('--sheet', help='Sheet name for Excel files')
+    import_parser.add_argument('--chunksize', type=int, default=50000, help='Rows to process at a time for CSV files')
+    import_parser.set_defaults(func=lambda cli, args: cli.import_permits(args.file, args.format, args.sheet, args.chunksize))
 
     # Import personal property command
     property_parser = subparsers.add_parser('import-property', help='Import personal property data')
-    property_parser.add_argument('file', help='Path to the personal property data file')
+    property_parser.add_argument('file', nargs='+', help='Path(s) to the personal property data file(s)')
     property_parser.add_argument('--format', help='File format (csv, xlsx, etc.)')
     property_parser.add_argument('--sheet', help='Sheet name for Excel files')
+    property_parser.add_argument('--chunksize', type=int, default=50000, help='Rows to process at a time for CSV files')
+    property_parser.set_defaults(func=lambda cli, args: cli.import_personal_property(args.file, args.format, args.sheet, args.chunksize))
 
     # Lookup parcel command
     lookup_parser = subparsers.add_parser('lookup-parcel', help='Look up parcel by address')
     lookup_parser.add_argument('address', help='Address to look up')
+    lookup_parser.set_defaults(func=lambda cli, args: cli.lookup_parcel(args.address))
 
     # Configuration command
     config_parser = subparsers.add_parser('config', help='Set up or update configuration')
     config_parser.add_argument('--ciaps', help='Path to CIAPS configuration file')
+    config_parser.set_defaults(func=lambda cli, args: cli.setup_config(args.ciaps))
 
     # Test database connection command
     test_parser = subparsers.add_parser('test-connection', help='Test database connection')
+    test_parser.set_defaults(func=lambda cli, args: cli.test_connection())
 
     # Version command
     version_parser = subparsers.add_parser('version', help='Show version information')
+    version_parser.set_defaults(func=_print_version)
 
+    return parser
+
+
+def cli_main():
+    """Main entry point for the command-line interface."""
     # Parse arguments
+    parser = _build_parser()
     args = parser.parse_args()
 
-    # Create CLI instance
-    cli = DataBridgeCLI()
-
-    # Execute appropriate command
-    if args.command == 'import-permits':
-        cli.import_permits(args.file, args.format, args.sheet)
-    elif args.command == 'import-property':
-        cli.import_personal_property(args.file, args.format, args.sheet)
-    elif args.command == 'lookup-parcel':
-        cli.lookup_parcel(args.address)
-    elif args.command == 'config':
-        cli.setup_config(args.ciaps)
-    elif args.command == 'test-connection':
-        cli.test_connection()
-    elif args.command == 'version':
-        print(f"PACS DataBridge v{__version__}")
-        print("A modern, AI-enhanced data import/export system for PACS TrueAutomation")
-    else:
+    # Execute the handler set by the chosen subcommand
+    if not hasattr(args, 'func'):
         parser.print_help()
+        return
+
+    args.func(DataBridgeCLI(), args)
 
 
 if __name__ == "__main__":
@@ -503,6 +503,7 @@ class ConfigManager:
                 }
             },
             "import": {
+                "engine": "pandas",
                 "permit": {
                     "default_schema": {},
                     "watch_folder": "C:\\PACS\\Permits\\Import",
@@ -515,7 +516,8 @@ class ConfigManager:
                 }
             },
             "export": {
-                "output_folder": "C:\\PACS\\Export"
+                "output_folder": "C:\\PACS\\Export",
+                "fast_writer": False
             },
             "logging": {
                 "level": "INFO",
@@ -362,7 +362,7 @@ Database connection module for PACS TrueAutomation and DataBridge databases.
 
 import pyodbc
 import pandas as pd
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -545,7 +545,9 @@ class DatabaseConnector:
             columns_str = ','.join(columns)
             query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
             
-            # Execute many
+            # Execute many, sending parameters as a single array instead of
+            # one round-trip per row
+            self.cursor.fast_executemany = True
             self.cursor.executemany(query, data)
             self.connection.commit()
             
@@ -618,9 +620,14 @@ class DatabaseConnector:
         
         try:
             if params:
-                return pd.read_sql(query, self.connection, params=params)
+                self.cursor.execute(query, params)
             else:
-                return pd.read_sql(query, self.connection)
+                self.cursor.execute(query)
+            
+            # Build the frame from the fetched rows in one pass; pd.read_sql on a
+            # raw pyodbc connection falls back to a slower generic path
+            columns = [column[0] for column in self.cursor.description]
+            return pd.DataFrame.from_records(self.cursor.fetchall(), columns=columns)
                 
         except Exception as e:
             logger.error(f"DataFrame query error: {str(e)}")
@@ -720,16 +727,7 @@ class PACSConnector(DatabaseConnector):
             result = self.execute_query(query, params)
             
             if result and len(result) > 0:
-                row = result[0]
-                return {
-                    'parcel_id': row[0],
-                    'parcel_number': row[1],
-                    'address': row[2],
-                    'city': row[3],
-                    'state': row[4],
-                    'zip': row[5],
-                    'owner_name': row[6]
-                }
+                return self._parcel_from_row(result[0])
             
             return None
             
@@ -737,6 +735,79 @@ class PACSConnector(DatabaseConnector):
             logger.error(f"Error searching for parcel by address: {str(e)}")
             return None
     
+    def get_parcel_by_address_iter(self, address: str, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Find all parcels matching an address, yielding them as they are fetched.
+        
+        Rows are fetched from the cursor in batches so large result sets are
+        never held in memory at once.
+        
+        Args:
+            address: Address to search for
+            batch_size: Number of rows to fetch per round trip
+        
+        Yields:
+            Parcel information dictionaries
+        """
+        if not self.is_connected():
+            if not self.connect():
+                return
+        
+        try:
+            address = address.strip().upper()
+            
+            query = """
+            SELECT
+                p.ParcelID,
+                p.ParcelNumber,
+                p.SitusAddress,
+                p.SitusCity,
+                p.SitusState,
+                p.SitusZip,
+                o.OwnerName
+            FROM 
+                Parcels p
+                LEFT JOIN ParcelOwners o ON p.ParcelID = o.ParcelID AND o.IsPrimary = 1
+            WHERE 
+                p.SitusAddress LIKE ?
+            ORDER BY
+                p.ParcelNumber ASC
+            """
+            
+            self.cursor.execute(query, (f"%{address}%",))
+            
+            while True:
+                rows = self.cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                
+                for row in rows:
+                    yield self._parcel_from_row(row)
+            
+        except Exception as e:
+            logger.error(f"Error searching for parcels by address: {str(e)}")
+    
+    @staticmethod
+    def _parcel_from_row(row: Tuple) -> Dict[str, Any]:
+        """
+        Convert a parcel query row to a dictionary.
+        
+        Args:
+            row: Row of parcel ID, number, address, city, state, zip and owner name
+        
+        Returns:
+            Parcel information
+        """
+        return {
+            'parcel_id': row[0],
+            'parcel_number': row[1],
+            'address': row[2],
+            'city': row[3],
+            'state': row[4],
+            'zip': row[5],
+            'owner_name': row[6]
+        }
+    
     def get_parcel_by_number(self, parcel_number: str) -> Optional[Dict[str, Any]]:
         """
         Find a parcel by parcel number.
@@ -780,16 +851,7 @@ class PACSConnector(DatabaseConnector):
             result = self.execute_query(query, params)
             
             if result and len(result) > 0:
-                row = result[0]
-                return {
-                    'parcel_id': row[0],
-                    'parcel_number': row[1],
-                    'address': row[2],
-                    'city': row[3],
-                    'state': row[4],
-                    'zip': row[5],
-                    'owner_name': row[6]
-                }
+                return self._parcel_from_row(result[0])
             
             return None
             
@@ -1128,3 +1190,48 @@ class DataBridgeConnector(DatabaseConnector):
         except Exception as e:
             logger.error(f"Error logging import error: {str(e)}")
             return False
+    
+    def bulk_insert_df(self, df: pd.DataFrame, table: str, batch_size: int = 10000) -> bool:
+        """
+        Insert a DataFrame into a table in batches.
+        
+        Each batch is sent with a single fast_executemany call and the whole
+        insert is committed once at the end. Missing values are inserted as NULL.
+        
+        Args:
+            df: DataFrame whose columns match the table columns
+            table: Table name
+            batch_size: Number of rows per executemany call
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if df.empty:
+            logger.warning("No data provided for bulk_insert_df")
+            return False
+        
+        if not self.is_connected():
+            if not self.connect():
+                return False
+        
+        try:
+            placeholders = ','.join(['?' for _ in df.columns])
+            columns_str = ','.join(df.columns)
+            query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
+            
+            self.cursor.fast_executemany = True
+            for start in range(0, len(df), batch_size):
+                batch = df.iloc[start:start + batch_size].astype(object)
+                batch = batch.where(batch.notna(), None)
+                self.cursor.executemany(query, list(batch.itertuples(index=False, name=None)))
+            
+            self.connection.commit()
+            
+            logger.info(f"Inserted {len(df)} rows into {table}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Bulk insert error: {str(e)}")
+            if self.connection:
+                self.connection.rollback()
+            return False
@@ -0,0 +1,138 @@
+"""
+File Reader Module
+
+Reads raw permit and personal property data files into pandas DataFrames,
+either whole or in bounded chunks. Shared by the permit and personal
+property parsers.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Iterator, Optional, Tuple, Union
+
+import pandas as pd
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Rows polars samples to infer column types
+_POLARS_SCHEMA_ROWS = 10000
+
+def _import_polars() -> Optional[Any]:
+    """
+    Import polars if it is installed.
+
+    Returns:
+        The polars module, or None if polars is not installed
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        logger.warning("polars is not installed, falling back to pandas CSV reader")
+        return None
+
+    return pl
+
+def _resolve_format(file_path: Union[str, Path], format_type: Optional[str]) -> Tuple[Path, str]:
+    """
+    Check that a data file exists and determine its format.
+
+    Args:
+        file_path: Path to data file
+        format_type: Optional file format override
+
+    Returns:
+        Tuple of (file path, format type)
+    """
+    file_path = Path(file_path)
+
+    if not file_path.is_file():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    # Determine file format if not specified
+    if format_type is None:
+        format_type = file_path.suffix.lower().lstrip('.')
+
+    if format_type not in ['csv', 'txt', 'xlsx', 'xls']:
+        raise ValueError(f"Unsupported file format: {format_type}")
+
+    return file_path, format_type
+
+def read_data_file(
+    file_path: Union[str, Path],
+    format_type: Optional[str] = None,
+    sheet_name: Optional[str] = None,
+    skip_rows: int = 0,
+    engine: str = 'pandas'
+) -> pd.DataFrame:
+    """
+    Read a whole CSV or Excel data file.
+
+    Args:
+        file_path: Path to data file
+        format_type: Optional file format override
+        sheet_name: Sheet name for Excel files
+        skip_rows: Number of rows to skip
+        engine: CSV reader to use ('pandas' or 'polars')
+
+    Returns:
+        DataFrame of raw records
+    """
+    file_path, format_type = _resolve_format(file_path, format_type)
+
+    if format_type in ['xlsx', 'xls']:
+        return pd.read_excel(file_path, sheet_name=sheet_name, skiprows=skip_rows)
+
+    pl = _import_polars() if engine == 'polars' else None
+    if pl is not None:
+        return pl.read_csv(file_path, skip_rows=skip_rows, infer_schema_length=_POLARS_SCHEMA_ROWS).to_pandas()
+
+    return pd.read_csv(file_path, skiprows=skip_rows, memory_map=True)
+
+def iter_data_file(
+    file_path: Union[str, Path],
+    format_type: Optional[str] = None,
+    sheet_name: Optional[str] = None,
+    skip_rows: int = 0,
+    chunksize: int = 50000,
+    engine: str = 'pandas'
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or Excel data file in chunks.
+
+    CSV files are streamed about ``chunksize`` rows at a time, so only one
+    chunk is held in memory with either engine. Excel files are read in full
+    and yielded as a single chunk.
+
+    Args:
+        file_path: Path to data file
+        format_type: Optional file format override
+        sheet_name: Sheet name for Excel files
+        skip_rows: Number of rows to skip
+        chunksize: Number of rows per chunk for CSV files
+        engine: CSV reader to use ('pandas' or 'polars')
+
+    Yields:
+        DataFrames of raw records
+    """
+    file_path, format_type = _resolve_format(file_path, format_type)
+
+    if format_type in ['xlsx', 'xls']:
+        yield pd.read_excel(file_path, sheet_name=sheet_name, skiprows=skip_rows)
+        return
+
+    pl = _import_polars() if engine == 'polars' else None
+    if pl is None:
+        with pd.read_csv(file_path, skiprows=skip_rows, chunksize=chunksize, memory_map=True) as reader:
+            yield from reader
+        return
+
+    # The batched reader parses the file incrementally instead of loading it whole
+    reader = pl.read_csv_batched(
+        file_path, skip_rows=skip_rows, batch_size=chunksize, infer_schema_length=_POLARS_SCHEMA_ROWS
+    )
+    while True:
+        batches = reader.next_batches(1)
+        if not batches:
+            break
+        yield batches[0].to_pandas()
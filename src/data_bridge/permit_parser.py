@@ -5,9 +5,10 @@ import os
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Any, Tuple
 
 from .address_matcher import AddressMatcher
+from .file_reader import iter_data_file, read_data_file
 
 # Configure logging
 logging.basicConfig(
@@ -41,7 +42,8 @@ class PermitParser:
         format_type: Optional[str] = None,
         sheet_name: Optional[str] = None,
         skip_rows: int = 0,
-        columns_map: Optional[Dict[str, str]] = None
+        columns_map: Optional[Dict[str, str]] = None,
+        engine: str = 'pandas'
     ) -> pd.DataFrame:
         """
         Parse permit data from file.
@@ -52,50 +54,103 @@ class PermitParser:
             sheet_name: Sheet name for Excel files
             skip_rows: Number of rows to skip
             columns_map: Mapping of source columns to standard fields
+            engine: CSV reader to use ('pandas' or 'polars')
 
         Returns:
             DataFrame with standardized permit data
         """
-        file_path = Path(file_path) if isinstance(file_path, str) else file_path
+        try:
+            df = read_data_file(file_path, format_type, sheet_name, skip_rows, engine)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+            logger.info(f"Successfully read {len(df)} records from {file_path}")
 
-        # Determine file format if not specified
-        if format_type is None:
-            format_type = file_path.suffix.lower().lstrip('.')
+            return self._process_frame(df, columns_map)
 
-        try:
-            # Parse file based on format
-            if format_type in ['csv', 'txt']:
-                df = pd.read_csv(file_path, skiprows=skip_rows)
-            elif format_type in ['xlsx', 'xls']:
-                df = pd.read_excel(file_path, sheet_name=sheet_name, skiprows=skip_rows)
-            else:
-                raise ValueError(f"Unsupported file format: {format_type}")
+        except Exception as e:
+            logger.error(f"Error parsing file {file_path}: {str(e)}")
+            raise
 
-            logger.info(f"Successfully read {len(df)} records from {file_path}")
+    def parse_file_iter(
+        self,
+        file_path: Union[str, Path],
+        format_type: Optional[str] = None,
+        sheet_name: Optional[str] = None,
+        skip_rows: int = 0,
+        columns_map: Optional[Dict[str, str]] = None,
+        chunksize: int = 50000,
+        engine: str = 'pandas'
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parse permit data from file in chunks.
 
-            # Apply column mapping if provided
-            if columns_map:
-                df = self._apply_column_mapping(df, columns_map)
+        CSV files are read ``chunksize`` rows at a time so only one chunk is
+        held in memory. Excel files are read in full and yielded as a single chunk.
 
-            # Clean and standardize data
-            df = self._clean_data(df)
+        Args:
+            file_path: Path to data file
+            format_type: Optional file format override
+            sheet_name: Sheet name for Excel files
+            skip_rows: Number of rows to skip
+            columns_map: Mapping of source columns to standard fields
+            chunksize: Number of rows per chunk for CSV files
+            engine: CSV reader to use ('pandas' or 'polars')
 
-            # Validate data
-            df = self._validate_data(df)
+        Yields:
+            DataFrames with standardized permit data
+        """
+        try:
+            chunks = iter_data_file(file_path, format_type, sheet_name, skip_rows, chunksize, engine)
 
-            # Match addresses to parcels if address matcher is available
-            if self.address_matcher and 'address' in df.columns:
-                df = self._match_addresses(df)
+            total = 0
+            for df in chunks:
+                total += len(df)
+                yield self._process_frame(df, columns_map)
 
-            return df
+            logger.info(f"Successfully read {total} records from {file_path}")
 
         except Exception as e:
             logger.error(f"Error parsing file {file_path}: {str(e)}")
             raise
 
+    def _process_frame(self, df: pd.DataFrame, columns_map: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """
+        Map, clean, validate and match a frame of raw permit records.
+
+        Args:
+            df: Raw DataFrame read from file
+            columns_map: Mapping of source columns to standard fields
+
+        Returns:
+            DataFrame with standardized permit data
+        """
+        # Apply column mapping if provided
+        if columns_map:
+            df = self._apply_column_mapping(df, columns_map)
+
+        # Clean and standardize data
+        df = self._clean_data(df)
+
+        # Validate data
+        df = self._validate_data(df)
+
+        # Match addresses to parcels if address matcher is available
+        return self.match_parcels(df)
+
+    def match_parcels(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Match cleaned permit records to parcels if an address matcher is available.
+
+        Args:
+            df: Cleaned and validated DataFrame
+
+        Returns:
+            DataFrame with matched parcel information
+        """
+        if self.address_matcher and 'address' in df.columns:
+            df = self._match_addresses(df)
+
+        return df
+
     def _apply_column_mapping(self, df: pd.DataFrame, columns_map: Dict[str, str]) -> pd.DataFrame:
         """
         Apply column mapping to rename columns to standard fields.
@@ -301,34 +356,38 @@ class PermitParser:
         if 'match_confidence' not in df.columns:
             df['match_confidence'] = 0.0
 
-        # Process each address
-        for idx, row in df.iterrows():
-            if pd.isna(row['address']) or row['address'] == '':
-                continue
+        # Only rows with an address and no parcel ID yet need matching
+        addresses = df['address']
+        parcel_ids = df['parcel_id']
+        needs_match = addresses.notna() & (addresses != '') & (parcel_ids.isna() | (parcel_ids == ''))
 
-            # Skip if already has a parcel ID
-            if 'parcel_id' in df.columns and not pd.isna(row['parcel_id']) and row['parcel_id'] != '':
-                continue
+        if not needs_match.any():
+            return df
+
+        try:
+            # Match the whole column in one batch; repeated addresses are looked up once
+            results = self.address_matcher.match_addresses(addresses[needs_match].tolist(), max_results=1)
 
-            try:
-                # Match address
-                matches = self.address_matcher.match_address(row['address'])
+        except Exception as e:
+            logger.error(f"Error matching addresses: {str(e)}")
+            df.loc[needs_match, 'validation_errors'] += 'Error matching address; '
+            return df
 
-                if matches and len(matches) > 0:
-                    # Get best match
-                    best_match = matches[0]
+        # Get best match for each row that found one
+        best_matches = [matches[0] for matches in results if matches]
+        if not best_matches:
+            return df
 
-                    # Update parcel information
-                    df.at[idx, 'parcel_id'] = best_match.get('pid', '')
-                    df.at[idx, 'match_confidence'] = best_match.get('confidence', 0.0)
+        found = needs_match.copy()
+        found[needs_match] = [len(matches) > 0 for matches in results]
 
-                    # Add validation warning for low confidence matches
-                    if best_match.get('confidence', 0.0) < 80.0:
-                        df.at[idx, 'validation_errors'] += 'Low confidence address match; '
+        # Update parcel information
+        df.loc[found, 'parcel_id'] = [match.get('pid', '') for match in best_matches]
+        df.loc[found, 'match_confidence'] = [match.get('confidence', 0.0) for match in best_matches]
 
-            except Exception as e:
-                logger.error(f"Error matching address {row['address']}: {str(e)}")
-                df.at[idx, 'validation_errors'] += 'Error matching address; '
+        # Add validation warning for low confidence matches
+        low_confidence = found & (df['match_confidence'] < 80.0)
+        df.loc[low_confidence, 'validation_errors'] += 'Low confidence address match; '
 
         return df
 
@@ -18,9 +18,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from data_bridge import __version__
-from data_bridge.cli import cli_main
-from data_bridge.db_setup import main as db_setup_main
-from data_bridge.api import start_api
 
 # Configure logging
 logging.basicConfig(
@@ -49,6 +46,40 @@ def start_web_ui(host="127.0.0.1", port=8501):
         logger.error(f"Error starting Streamlit web UI: {str(e)}")
         sys.exit(1)
 
+def _run_cli(args):
+    """Run the CLI, passing the remaining arguments through."""
+    from data_bridge.cli import cli_main
+    
+    sys.argv = [sys.argv[0]] + args.cli_args
+    cli_main()
+
+def _run_db_setup(args):
+    """Run the database setup."""
+    from data_bridge.db_setup import main as db_setup_main
+    
+    db_setup_main()
+
+def _run_api(args):
+    """Start the web API."""
+    from data_bridge.api import start_api
+    
+    logger.info(f"Starting web API on {args.host}:{args.port}")
+    start_api(host=args.host, port=args.port)
+
+def _print_version(args):
+    """Print version information."""
+    print(f"PACS DataBridge v{__version__}")
+    print("A modern, AI-enhanced data import/export system for PACS TrueAutomation")
+
+# Component launchers, keyed by component name
+_COMPONENTS = {
+    'cli': _run_cli,
+    'db-setup': _run_db_setup,
+    'api': _run_api,
+    'web-ui': lambda args: start_web_ui(host=args.host, port=args.port),
+    'version': _print_version
+}
+
 def main():
     """Main entry point for the PACS DataBridge system."""
     # Create argument parser
@@ -84,23 +115,13 @@ def main():
     args = parser.parse_args()
     
     # Launch appropriate component
-    if args.component == 'cli':
-        # Pass remaining arguments to CLI
-        sys.argv = [sys.argv[0]] + args.cli_args
-        cli_main()
-    elif args.component == 'db-setup':
-        db_setup_main()
-    elif args.component == 'api':
-        logger.info(f"Starting web API on {args.host}:{args.port}")
-        start_api(host=args.host, port=args.port)
-    elif args.component == 'web-ui':
-        start_web_ui(host=args.host, port=args.port)
-    elif args.component == 'version':
-        print(f"PACS DataBridge v{__version__}")
-        print("A modern, AI-enhanced data import/export system for PACS TrueAutomation")
-    else:
+    component = _COMPONENTS.get(args.component)
+    if component is None:
         # Show help if no component specified
         parser.print_help()
+        return
+    
+    component(args)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 import sys
 from pathlib import Path
+import pandas as pd
 
 # Add the src directory to the path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
@@ -47,6 +48,10 @@ class TestAddressMatcher(unittest.TestCase):
         self.assertEqual(self.matcher._normalize_address('123 Main St, Apt 4B'), '123 MAIN ST')
         self.assertEqual(self.matcher._normalize_address('123 Main St #101'), '123 MAIN ST')
         
+        # Test hyphenated street types and directionals
+        self.assertEqual(self.matcher._normalize_address('123 Main-Street'), '123 MAIN ST')
+        self.assertEqual(self.matcher._normalize_address('3 North-South Highway'), '3 N S HWY')
+        
         # Test whitespace handling
         self.assertEqual(self.matcher._normalize_address('  123   Main   St  '), '123 MAIN ST')
         
@@ -74,6 +79,15 @@ class TestAddressMatcher(unittest.TestCase):
         self.assertEqual(result['street_name'], 'N MAIN')
         self.assertEqual(result['street_type'], 'ST')
     
+    def test_parse_addresses(self):
+        """Test vectorized address parsing matches scalar parsing."""
+        addresses = pd.Series(['123 MAIN ST', '123 MAIN', '123 N MAIN ST', 'MAIN ST'])
+        result = self.matcher.parse_addresses(addresses)
+
+        for idx, address in addresses.items():
+            expected = self.matcher._parse_address(address)
+            self.assertEqual(result.loc[idx].to_dict(), expected)
+    
     def test_match_address(self):
         """Test address matching."""
         # Test exact match
@@ -97,6 +111,124 @@ class TestAddressMatcher(unittest.TestCase):
         matches = self.matcher.match_address('999 Nonexistent Rd')
         self.assertEqual(len(matches), 0)
     
+    def test_candidate_query(self):
+        """Test that candidates are filtered by street number and name in SQL."""
+        self.matcher.match_address('123 Main St')
+
+        query, params = self.mock_db.execute_query.call_args[0]
+        self.assertIn('street_number = ? AND street_name LIKE ?', query)
+        self.assertNotIn('SOUNDEX', query)
+        self.assertEqual(params, ('123', '%MAIN%'))
+
+    def test_match_addresses(self):
+        """Test batch matching agrees with single-address matching."""
+        addresses = ['123 Main St', '', '123 North Main St', '123 main street']
+        results = self.matcher.match_addresses(addresses)
+
+        # One query per distinct normalized address
+        self.assertEqual(len(results), len(addresses))
+        self.assertEqual(self.mock_db.execute_query.call_count, 2)
+        self.assertEqual(results[1], [])
+        self.assertEqual(results[0], results[3])
+
+        single = AddressMatcher(self.mock_db)
+        for address, matches in zip(addresses, results):
+            self.assertEqual(matches, single.match_address(address))
+
+    def test_match_addresses_tie_order(self):
+        """Test that batch and single matching break score ties the same way."""
+        # Rows of one tied address interleaved with another's
+        self.mock_db.execute_query.return_value = [
+            ('A1', '123 MAIN ST', '123', 'MAIN', 'ST', 'ANYTOWN', 'US', '12345'),
+            ('B1', '123 MAIN ST N', '123', 'MAIN', 'ST', 'ANYTOWN', 'US', '12345'),
+            ('A2', '123 MAIN ST', '123', 'MAIN', 'ST', 'ANYTOWN', 'US', '12345')
+        ]
+        self.matcher.scorer = lambda query, choice, **kwargs: 80.0
+
+        batch = self.matcher.match_addresses(['123 Main Road'])[0]
+        self.matcher.clear_cache()
+        single = self.matcher.match_address('123 Main Road')
+
+        self.assertEqual([m['pid'] for m in batch], ['A1', 'B1', 'A2'])
+        self.assertEqual(single, batch)
+
+    def test_match_addresses_larger_than_cache(self):
+        """Test that a batch larger than the cache still returns every result."""
+        self.matcher.address_cache.maxsize = 2
+        addresses = ['123 Main St', '123 North Main St', '123 Main', '123 Main St']
+
+        results = self.matcher.match_addresses(addresses)
+
+        single = AddressMatcher(self.mock_db)
+        self.assertEqual(results, [single.match_address(address) for address in addresses])
+        self.assertTrue(all(results))
+        self.assertEqual(len(self.matcher.address_cache), 2)
+
+    def test_parcel_index(self):
+        """Test matching against a loaded parcel index."""
+        self.assertTrue(self.matcher.load_parcel_index())
+        self.assertEqual(self.mock_db.execute_query.call_count, 1)
+
+        # '123 MAIN ST' and '123 MAIN STREET' normalize to the same key
+        self.assertEqual(len(self.matcher.parcel_index_keys), 2)
+
+        matches = self.matcher.match_address('123 Main St')
+        self.assertEqual([m['pid'] for m in matches[:2]], ['123456', '789012'])
+        self.assertEqual(matches[0]['confidence'], 100.0)
+
+        # Lookups no longer hit the database
+        self.matcher.match_addresses(['123 N Main St', '456 Oak Ave'])
+        self.assertEqual(self.mock_db.execute_query.call_count, 1)
+
+    def test_parcel_index_exact_match(self):
+        """Test that an exact index hit skips fuzzy scoring."""
+        self.matcher.load_parcel_index()
+
+        with patch('src.data_bridge.address_matcher.process.extract') as mock_extract:
+            matches = self.matcher.match_addresses(['123 Main Street'], max_results=1)
+            mock_extract.assert_not_called()
+
+        self.assertEqual(matches, [[dict(zip(AddressMatcher.PARCEL_COLUMNS, self.sample_results[0]), confidence=100.0)]])
+
+        # Misses still fall through to fuzzy scoring
+        matches = self.matcher.match_addresses(['123 Main Stret'], max_results=1)
+        self.assertEqual(matches[0][0]['pid'], '123456')
+        self.assertLess(matches[0][0]['confidence'], 100.0)
+
+    def test_exact_match_skips_fuzzy_scoring(self):
+        """Test that an exact hit is returned with default max_results without fuzzy scoring."""
+        self.mock_db.execute_query.return_value = self.sample_results[:1]
+
+        with patch('src.data_bridge.address_matcher.process.cpdist') as mock_cpdist:
+            single = self.matcher.match_address('123 Main St')
+            self.matcher.clear_cache()
+            batch = self.matcher.match_addresses(['123 Main St'])[0]
+            mock_cpdist.assert_not_called()
+
+        expected = [dict(zip(AddressMatcher.PARCEL_COLUMNS, self.sample_results[0]), confidence=100.0)]
+        self.assertEqual(single, expected)
+        self.assertEqual(batch, expected)
+
+    def test_exact_matches_come_first(self):
+        """Test that exact hits lead and fuzzy matches fill the remaining slots."""
+        matches = self.matcher.match_address('123 North Main St')
+
+        self.assertEqual(matches[0]['pid'], '345678')
+        self.assertEqual(matches[0]['confidence'], 100.0)
+        self.assertEqual(sorted(m['pid'] for m in matches[1:]), ['123456', '789012'])
+        self.assertTrue(all(m['confidence'] < 100.0 for m in matches[1:]))
+
+    def test_parcel_index_exact_match_scorer(self):
+        """Test that an exact index hit is scored with the configured scorer."""
+        self.matcher.scorer = lambda query, choice, **kwargs: 90.0
+        self.matcher.load_parcel_index()
+
+        matches = self.matcher.match_addresses(['123 Main Street'], max_results=1)
+        self.assertEqual(matches[0][0]['confidence'], 90.0)
+
+        # Below the cutoff the exact key is not returned
+        self.assertEqual(self.matcher.match_addresses(['123 Main Street'], min_confidence=95, max_results=1), [[]])
+
     def test_match_address_with_threshold(self):
         """Test address matching with confidence threshold."""
         # Set a high threshold
@@ -132,5 +264,29 @@ class TestAddressMatcher(unittest.TestCase):
         self.matcher.match_address('123 Main St')
         self.assertEqual(self.mock_db.execute_query.call_count, 3)
 
+        # Same street number and name reuses the fetched candidate block
+        self.matcher.match_address('123 Main')
+        self.assertEqual(self.mock_db.execute_query.call_count, 3)
+
+    def test_cache_is_bounded(self):
+        """Test that the address cache evicts least recently used entries."""
+        self.matcher.address_cache.maxsize = 2
+
+        self.matcher.match_address('123 Main St')
+        self.matcher.match_address('456 Oak Ave')
+        self.matcher.match_address('123 Main St')
+        self.matcher.match_address('789 Elm Rd')
+
+        self.assertEqual(list(self.matcher.address_cache), [('123 MAIN ST', 70.0, 5), ('789 ELM RD', 70.0, 5)])
+
+    def test_cache_is_keyed_by_match_options(self):
+        """Test that results cached for one result limit are not reused for another."""
+        best = self.matcher.match_addresses(['123 Main St'], max_results=1)[0]
+        self.assertEqual(len(best), 1)
+
+        matches = self.matcher.match_address('123 Main St')
+        self.assertGreater(len(matches), 1)
+        self.assertEqual(matches[0], best[0])
+
 if __name__ == '__main__':
     unittest.main()
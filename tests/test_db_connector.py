@@ -17,16 +17,17 @@ from src.data_bridge.db_connector import DatabaseConnector, PACSConnector, DataB
 class TestDatabaseConnector(unittest.TestCase):
     """Test cases for the DatabaseConnector class."""
 
-    @patch('src.data_bridge.db_connector.pyodbc')
-    def setUp(self, mock_pyodbc):
+    def setUp(self):
         """Set up test fixtures."""
         # Configure mock cursor
         self.mock_cursor = MagicMock()
         self.mock_connection = MagicMock()
         self.mock_connection.cursor.return_value = self.mock_cursor
 
-        # Configure mock pyodbc
-        mock_pyodbc.connect.return_value = self.mock_connection
+        # Patch pyodbc.connect for the whole test, not just setUp
+        patcher = patch('src.data_bridge.db_connector.pyodbc.connect', return_value=self.mock_connection)
+        self.mock_connect = patcher.start()
+        self.addCleanup(patcher.stop)
 
         # Create database connector
         self.db = DatabaseConnector(
@@ -126,6 +127,7 @@ class TestDatabaseConnector(unittest.TestCase):
 
         # Check result
         self.assertTrue(result)
+        self.assertTrue(self.mock_cursor.fast_executemany)
         self.mock_cursor.executemany.assert_called_once()
         self.mock_connection.commit.assert_called_once()
 
@@ -150,22 +152,21 @@ class TestDatabaseConnector(unittest.TestCase):
 
     def test_query_to_dataframe(self):
         """Test query to DataFrame conversion."""
-        # Mock pd.read_sql
-        with patch('src.data_bridge.db_connector.pd.read_sql') as mock_read_sql:
-            # Configure mock
-            mock_df = pd.DataFrame({'col1': [1, 2], 'col2': ['a', 'b']})
-            mock_read_sql.return_value = mock_df
+        # Configure mock cursor
+        self.mock_cursor.description = [('col1',), ('col2',)]
+        self.mock_cursor.fetchall.return_value = [(1, 'a'), (2, 'b')]
 
-            # Connect
-            self.db.connect()
+        # Connect
+        self.db.connect()
 
-            # Execute query
-            df = self.db.query_to_dataframe("SELECT * FROM test")
+        # Execute query
+        df = self.db.query_to_dataframe("SELECT * FROM test")
 
-            # Check result
-            self.assertIsInstance(df, pd.DataFrame)
-            self.assertEqual(len(df), 2)
-            mock_read_sql.assert_called_once()
+        # Check result
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(len(df), 2)
+        self.assertEqual(list(df.columns), ['col1', 'col2'])
+        self.mock_cursor.execute.assert_called_with("SELECT * FROM test")
 
     def test_table_exists(self):
         """Test table existence check."""
@@ -251,6 +252,25 @@ class TestPACSConnector:
         result = pacs_connector.get_parcel_by_address("999 Nonexistent St")
         assert result is None
     
+    def test_get_parcel_by_address_iter(self):
+        """Test get_parcel_by_address_iter fetches rows in batches."""
+        connector = PACSConnector(server="test_server")
+        connector.connection = MagicMock()
+        connector.cursor = MagicMock()
+        connector.cursor.fetchmany.side_effect = [
+            [(1, "111", "123 MAIN ST", "ANYTOWN", "TX", "12345", "JOHN DOE"),
+             (2, "222", "123 MAIN ST APT 2", "ANYTOWN", "TX", "12345", None)],
+            [(3, "333", "1123 MAIN ST", "ANYTOWN", "TX", "12345", "JANE DOE")],
+            []
+        ]
+        
+        parcels = list(connector.get_parcel_by_address_iter("123 Main St", batch_size=2))
+        
+        assert [p["parcel_number"] for p in parcels] == ["111", "222", "333"]
+        assert parcels[0]["owner_name"] == "JOHN DOE"
+        assert connector.cursor.execute.call_args[0][1] == ("%123 MAIN ST%",)
+        connector.cursor.fetchmany.assert_called_with(2)
+    
     def test_get_parcel_by_number(self, pacs_connector):
         """Test get_parcel_by_number method."""
         # Set up mock return value for execute_query
@@ -432,6 +452,28 @@ class TestDataBridgeConnector:
         assert result == True
         db_connector.execute_query.assert_called_once()
         db_connector.connection.commit.assert_called_once()
+    
+    def test_bulk_insert_df(self):
+        """Test bulk_insert_df sends the DataFrame in batches."""
+        connector = DataBridgeConnector(server="test_server")
+        connector.connection = MagicMock()
+        connector.cursor = MagicMock()
+        
+        df = pd.DataFrame({
+            'PermitNumber': ['BP-1', 'BP-2', 'BP-3'],
+            'Valuation': [100.0, None, 300.0]
+        })
+        
+        result = connector.bulk_insert_df(df, 'PermitStaging', batch_size=2)
+        
+        assert result == True
+        assert connector.cursor.fast_executemany == True
+        calls = connector.cursor.executemany.call_args_list
+        assert len(calls) == 2
+        assert calls[0][0][0] == "INSERT INTO PermitStaging (PermitNumber,Valuation) VALUES (?,?)"
+        assert calls[0][0][1] == [('BP-1', 100.0), ('BP-2', None)]
+        assert calls[1][0][1] == [('BP-3', 300.0)]
+        connector.connection.commit.assert_called_once()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
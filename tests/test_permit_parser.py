@@ -5,6 +5,7 @@ Unit tests for the permit_parser module.
 import os
 import pytest
 import pandas as pd
+from unittest.mock import MagicMock
 from pathlib import Path
 
 from data_bridge.permit_parser import PermitParser
@@ -75,6 +76,15 @@ class TestPermitParser:
         assert improvements.iloc[1] == 'REMODEL'  # Kitchen Remodel
         assert improvements.iloc[2] == 'TENANT_IMPROVEMENT'  # Commercial Tenant Improvement
     
+    def test_parse_file_iter(self, parser, sample_csv_path):
+        """Test that chunked parsing matches parsing the whole file."""
+        chunks = list(parser.parse_file_iter(sample_csv_path, chunksize=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+
+        df = pd.concat(chunks, ignore_index=True)
+        pd.testing.assert_frame_equal(df, parser.parse_file(sample_csv_path))
+
     def test_extract_parcel_numbers(self, parser):
         """Test parcel number extraction from text."""
         # Sample text with parcel numbers in different formats
@@ -86,5 +96,28 @@ class TestPermitParser:
         assert parser.extract_parcel_number(text1) == '12345678'
         assert parser.extract_parcel_number(text2) == '123456789'
         assert parser.extract_parcel_number(text3) == '98765432'
-    
+
+    def test_match_addresses_batch(self):
+        """Test that address matching is done in one batch call."""
+        matcher = MagicMock()
+        matcher.match_addresses.return_value = [
+            [{'pid': 'P1', 'confidence': 95.0}],
+            [{'pid': 'P2', 'confidence': 75.0}],
+            []
+        ]
+        parser = PermitParser(matcher)
+
+        df = pd.DataFrame({
+            'address': ['123 Main St', '', '456 Oak Ave', '789 Nowhere Rd', '123 Main St'],
+            'parcel_id': ['', '', '', '', 'EXISTING'],
+            'validation_errors': [''] * 5
+        })
+        result = parser._match_addresses(df)
+
+        # Blank addresses and rows with a parcel ID are not matched
+        matcher.match_addresses.assert_called_once_with(['123 Main St', '456 Oak Ave', '789 Nowhere Rd'], max_results=1)
+        assert result['parcel_id'].tolist() == ['P1', '', 'P2', '', 'EXISTING']
+        assert result['match_confidence'].tolist() == [95.0, 0.0, 75.0, 0.0, 0.0]
+        assert result['validation_errors'].iloc[2] == 'Low confidence address match; '
+
     # More tests would be added for other functionality...